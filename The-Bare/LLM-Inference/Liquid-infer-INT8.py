@@ -1,31 +1,92 @@
+import argparse
+import sys
+
 from llama_cpp import Llama
+from llama_cpp.llama_cache import LlamaRAMCache
+
+# GGML type ids for the KV cache (ggml.h): F16=1, Q4_0=2, Q8_0=8
+# Quantized KV halves (Q8_0) or quarters (Q4_0) cache memory traffic,
+# which is what bounds tokens/sec during CPU decode at n_ctx=4096.
+KV_CACHE_TYPES = {
+    "f16": 1,
+    "q8_0": 8,
+    "q4_0": 2,
+}
+
+parser = argparse.ArgumentParser(description="LFM-1.2B INT8 chat (CLI)")
+parser.add_argument(
+    "--kv-quant", choices=KV_CACHE_TYPES, default="q8_0",
+    help="KV cache quantization type (default: q8_0)",
+)
+args = parser.parse_args()
+
+kv_type = KV_CACHE_TYPES[args.kv_quant]
+
+# Offload every layer to the GPU when one is visible (CUDA or Metal);
+# llama.cpp falls back cleanly to CPU-only with n_gpu_layers=0
+try:
+    import torch
+    n_gpu_layers = -1 if torch.cuda.is_available() or torch.backends.mps.is_available() else 0
+except ImportError:
+    n_gpu_layers = 0
 
 # Initialize the model with optimized CPU parameters
 llm = Llama(
     model_path="../../models/LFM-1.2B-INT8.gguf",
+    n_gpu_layers=n_gpu_layers,  # -ngl -1 when a GPU is available
     n_ctx=4096,           # -c 4096
     n_threads=8,          # -t 8
     n_threads_batch=8,    # -tb 8
-    n_batch=256,          # -b 256
+    n_batch=512 if kv_type != KV_CACHE_TYPES["f16"] else 256,  # freed KV memory -> larger batch
     n_ubatch=64,        # Micro-batching support depends on llama-cpp-python version
-    flash_attn=True,      # -fa 1
+    flash_attn=True,      # -fa 1 (required by llama.cpp for quantized KV)
     use_mmap=True,        # --mmap
-    type_k=1,             # KV cache type F16
-    type_v=1,             # KV cache type F16
+    type_k=kv_type,       # KV cache type
+    type_v=kv_type,       # KV cache type
     verbose=False,
 )
 
-# Conversation history to maintain context
+# Cache KV state between turns so each request only prefills the new
+# user turn instead of re-prefilling the whole conversation (O(N) vs O(N^2)).
+llm.set_cache(LlamaRAMCache(capacity_bytes=512 << 20))
+
+# Conversation history to maintain context, with exact per-message token
+# counts (parallel list) so the context budget is tracked incrementally
+# instead of recounting the whole history every turn
 messages = []
+token_counts = []
+total_tokens = 0
+
+# Interactive sessions get prompt_toolkit (history/line editing) when it's
+# installed; piped stdin (e.g. `cat prompts.txt | python Liquid-infer-INT8.py`)
+# reads plain buffered lines with no TTY prompt overhead, which makes
+# scripted throughput runs reliable
+if sys.stdin.isatty():
+    try:
+        from prompt_toolkit import PromptSession
+        _session = PromptSession()
+        def read_prompt():
+            return _session.prompt("\n\nYou: ")
+    except ImportError:
+        def read_prompt():
+            return input("\n\nYou: ")
+else:
+    def read_prompt():
+        line = sys.stdin.readline()
+        return line.rstrip("\n") if line else None  # None on EOF
 
 while True:
-    user_input = input("\n\nYou: ")
-    if user_input.lower() in ['exit', 'quit']:
+    user_input = read_prompt()
+    if user_input is None or user_input.lower() in ['exit', 'quit']:
         break
-    
+    if not user_input.strip():
+        continue
+
     # Add user message to conversation history
     messages.append({"role": "user", "content": user_input})
-    
+    token_counts.append(len(llm.tokenize(user_input.encode("utf-8"), add_bos=False)))
+    total_tokens += token_counts[-1]
+
     # Run inference with streaming chat completion
     print("Assistant: ", end="", flush=True)
     response_text = ""
@@ -50,9 +111,19 @@ while True:
     
     # Add assistant response to conversation history
     messages.append({"role": "assistant", "content": response_text})
-    
+    token_counts.append(len(llm.tokenize(response_text.encode("utf-8"), add_bos=False)))
+    total_tokens += token_counts[-1]
+
     # Keep only recent messages if context exceeds limits
-    # Estimate ~4 tokens per word, leave buffer for new generation
-    total_tokens = sum(len(msg["content"].split()) * 4 for msg in messages)
-    if total_tokens > 3500:  # Keep under 4096 limit with safety margin
-        messages = messages[-10:]  # Keep last 5 exchanges (user + assistant pairs)
\ No newline at end of file
+    # Note: evicting the oldest turns invalidates the cached KV prefix (the
+    # cache keys on the front of the prompt), so the turn after an eviction
+    # pays one full re-prefill. That's the accepted trade for keeping the
+    # most recent turns — llama-cpp-python has no KV-shift API to do better.
+    while total_tokens > 3500 and len(messages) > 2:  # Keep under 4096 limit with safety margin
+        messages.pop(0)
+        total_tokens -= token_counts.pop(0)
+        # Keep popping until the history starts on a user turn again;
+        # strict chat templates reject a leading assistant message
+        while messages and messages[0]["role"] != "user":
+            messages.pop(0)
+            total_tokens -= token_counts.pop(0)
\ No newline at end of file
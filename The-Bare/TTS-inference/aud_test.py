@@ -1,6 +1,7 @@
+from __future__ import annotations
 
-import torch 
-import random, os, sys
+import torch
+import contextlib, inspect, json, random, os, re, sys
 import numpy as np
 
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
@@ -13,23 +14,40 @@ def set_seed(seed: int):
     random.seed(seed)
     np.random.seed(seed)
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-import librosa
-import torch.nn.functional as F
-from huggingface_hub import hf_hub_download
-from safetensors.torch import load_file
 
+# torchaudio, safetensors, huggingface_hub and the chichat submodules are
+# deliberately imported inside the methods that need them: they drag in the
+# heavy scipy/tokenizers/C-ext stack, which would otherwise be paid even for
+# `--help`. Annotations referencing chichat types stay strings thanks to the
+# __future__ import above.
 # from chichat import perth # need chichat; pip install chichat
-from chichat.chatterbox.models.t3 import T3
-from chichat.chatterbox.models.s3tokenizer import S3_SR, drop_invalid_tokens
-from chichat.chatterbox.models.s3gen import S3GEN_SR, S3Gen
-from chichat.chatterbox.models.tokenizers import EnTokenizer
-from chichat.chatterbox.models.voice_encoder import VoiceEncoder
-from chichat.chatterbox.models.t3.modules.cond_enc import T3Cond
 
 REPO_ID = "callgg/chatterbox-encoder"
 
+# Uncommon/llm punc, replaced in a single pass instead of one
+# O(N) text.replace scan per pattern: single chars go through a
+# C-level translation table, multi-char sequences through one regex.
+_PUNC_TABLE = str.maketrans({
+    "…": ", ",
+    ":": ",",
+    ";": ", ",
+    "—": "-",
+    "–": "-",
+    "“": "\"",
+    "”": "\"",
+    "‘": "'",
+    "’": "'",
+})
+_PUNC_REPL = {
+    "...": ", ",
+    " - ": ", ",
+    " ,": ",",
+}
+_PUNC_RE = re.compile(r"\.\.\.| - | ,")
+
 def punc_norm(text: str) -> str:
     """
         Quick cleanup func for punctuation from LLMs or
@@ -40,27 +58,14 @@ def punc_norm(text: str) -> str:
     # Capitalise first letter
     if text[0].islower():
         text = text[0].upper() + text[1:]
-    # Remove multiple space chars
+    # Remove multiple space chars (before the regex pass so " - " matches)
     text = " ".join(text.split())
     # Replace uncommon/llm punc
-    punc_to_replace = [
-        ("...", ", "),
-        ("…", ", "),
-        (":", ","),
-        (" - ", ", "),
-        (";", ", "),
-        ("—", "-"),
-        ("–", "-"),
-        (" ,", ","),
-        ("“", "\""),
-        ("”", "\""),
-        ("‘", "'"),
-        ("’", "'"),
-    ]
-    for old_char_sequence, new_char in punc_to_replace:
-        text = text.replace(old_char_sequence, new_char)
+    text = _PUNC_RE.sub(lambda m: _PUNC_REPL[m.group()], text).translate(_PUNC_TABLE)
+    # Re-collapse spaces the substitutions introduced, then clean the
+    # " ," residue they can leave behind
+    text = " ".join(text.split()).replace(" ,", ",")
     # Add full stop if no ending punc
-    text = text.rstrip(" ")
     sentence_enders = {".", "!", "?", "-", ","}
     if not any(text.endswith(p) for p in sentence_enders):
         text += "."
@@ -105,23 +110,63 @@ class Conditionals:
         return self
 
     def save(self, fpath: Path):
-        arg_dict = dict(
-            t3=self.t3.__dict__,
-            gen=self.gen
-        )
-        torch.save(arg_dict, fpath)
+        from safetensors.torch import save_file
+
+        # Tensors go into safetensors (mmap-able, no pickle); everything else
+        # into a small JSON sidecar next to it
+        fpath = Path(fpath)
+        tensors = {}
+        extras = {}
+        for prefix, fields in (("t3", self.t3.__dict__), ("gen", self.gen)):
+            for k, v in fields.items():
+                if torch.is_tensor(v):
+                    tensors[f"{prefix}.{k}"] = v.contiguous()
+                elif v is not None:
+                    extras[f"{prefix}.{k}"] = v
+        save_file(tensors, fpath)
+        fpath.with_suffix(".json").write_text(json.dumps({"version": 1, "extras": extras}))
+
+    @staticmethod
+    def _is_safetensors(fpath):
+        # A safetensors file opens with a u64 header length followed by a
+        # JSON header ('{' at byte 8); torch.save zip/pickle payloads don't.
+        # Sniffing the header instead of the extension keeps save() output
+        # loadable under any filename, including the traditional conds.pt
+        with open(fpath, "rb") as f:
+            head = f.read(9)
+        return len(head) == 9 and head[8:9] == b"{"
 
     @classmethod
     def load(cls, fpath, map_location="cpu"):
+        from safetensors.torch import load_file
+        from chichat.chatterbox.models.t3.modules.cond_enc import T3Cond
+
         if isinstance(map_location, str):
             map_location = torch.device(map_location)
-        kwargs = torch.load(fpath, map_location=map_location, weights_only=True)
-        return cls(T3Cond(**kwargs['t3']), kwargs['gen'])
+        fpath = Path(fpath)
+        # Legacy torch.save checkpoints (e.g. the hub's conds.pt) still load
+        # through pickle; everything saved by us is safetensors
+        if not cls._is_safetensors(fpath):
+            kwargs = torch.load(fpath, map_location=map_location, weights_only=True)
+            return cls(T3Cond(**kwargs['t3']), kwargs['gen'])
+        t3_kwargs = {}
+        gen = {}
+        def put(key, value):
+            prefix, name = key.split(".", 1)
+            (t3_kwargs if prefix == "t3" else gen)[name] = value
+        # from_local passes map_location=None on CUDA; safetensors needs a
+        # real device string, so load to cpu and let the caller's .to(device)
+        # place the tensors
+        st_device = "cpu" if map_location is None else str(map_location)
+        for key, value in load_file(fpath, device=st_device).items():
+            put(key, value)
+        sidecar = fpath.with_suffix(".json")
+        if sidecar.exists():
+            for key, value in json.loads(sidecar.read_text()).get("extras", {}).items():
+                put(key, value)
+        return cls(T3Cond(**t3_kwargs), gen)
 
 class ChatterboxTTS:
-    ENC_COND_LEN = 6 * S3_SR
-    DEC_COND_LEN = 10 * S3GEN_SR
-
     def __init__(
         self,
         t3: T3,
@@ -131,17 +176,48 @@ class ChatterboxTTS:
         device: str,
         conds: Conditionals = None,
     ):
+        from chichat.chatterbox.models.s3tokenizer import S3_SR
+        from chichat.chatterbox.models.s3gen import S3GEN_SR
+
         self.sr = S3GEN_SR  # sample rate of synthesized audio
+        self.ENC_COND_LEN = 6 * S3_SR
+        self.DEC_COND_LEN = 10 * S3GEN_SR
         self.t3 = t3
         self.s3gen = s3gen
         self.ve = ve
         self.tokenizer = tokenizer
         self.device = device
         self.conds = conds
+        # Cached torchaudio.transforms.Resample modules keyed by
+        # (orig_sr, target_sr) so repeated conditioning reuses the sinc table
+        self._resamplers = {}
+        # Reusable pinned host buffer backing D2H audio copies (see
+        # _pinned_host_buf); allocated lazily since pinning needs CUDA
+        self._host_buf = None
+        # Per-instance RNG for sampling: re-seeding it doesn't mutate the
+        # global torch/numpy/random state and skips the device-wide work of
+        # torch.cuda.manual_seed_all on every call
+        self.rng = torch.Generator(device=device)
+        # t3.inference may predate the generator= kwarg (and may be wrapped
+        # by torch.compile), so detect support once up front
+        inner = getattr(
+            t3.inference, "_torchdynamo_orig_callable",
+            getattr(t3.inference, "__wrapped__", t3.inference),
+        )
+        try:
+            self._t3_takes_generator = "generator" in inspect.signature(inner).parameters
+        except (TypeError, ValueError):
+            self._t3_takes_generator = False
         # self.watermarker = perth.PerthImplicitWatermarker
 
     @classmethod
     def from_local(cls, ckpt_dir, device, vae_path, clip_path, model_path) -> 'ChatterboxTTS':
+        from safetensors.torch import load_file
+        from chichat.chatterbox.models.t3 import T3
+        from chichat.chatterbox.models.s3gen import S3Gen
+        from chichat.chatterbox.models.tokenizers import EnTokenizer
+        from chichat.chatterbox.models.voice_encoder import VoiceEncoder
+
         ckpt_dir = Path(ckpt_dir)
 
         # Always load to CPU first for non-CUDA devices to handle CUDA-saved models
@@ -149,24 +225,45 @@ class ChatterboxTTS:
             map_location = torch.device('cpu')
         else:
             map_location = None
-        ve = VoiceEncoder()
-        ve.load_state_dict(
-            load_file(vae_path)
-        )
-        ve.to(device).eval()
-
-        t3 = T3()
-        t3_state = load_file(clip_path)
-        if "model" in t3_state.keys():
-            t3_state = t3_state["model"][0]
-        t3.load_state_dict(t3_state)
-        t3.to(device).eval()
-
-        s3gen = S3Gen()
-        s3gen.load_state_dict(
-            load_file(model_path), strict=False
-        )
-        s3gen.to(device).eval()
+        # The three state-dict reads are independent and I/O-bound on a cold
+        # cache; safetensors releases the GIL, so overlap them in threads and
+        # let each finished read feed the (serial) load_state_dict/.to(device)
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            ve_future = ex.submit(load_file, vae_path)
+            t3_future = ex.submit(load_file, clip_path)
+            s3gen_future = ex.submit(load_file, model_path)
+
+            ve = VoiceEncoder()
+            ve.load_state_dict(ve_future.result())
+            ve.to(device).eval()
+
+            t3 = T3()
+            t3_state = t3_future.result()
+            if "model" in t3_state.keys():
+                t3_state = t3_state["model"][0]
+            t3.load_state_dict(t3_state)
+            t3.to(device).eval()
+
+            s3gen = S3Gen()
+            s3gen.load_state_dict(
+                s3gen_future.result(), strict=False
+            )
+            s3gen.to(device).eval()
+
+        # Compile the hot inference paths: fuses pointwise ops and strips the
+        # per-step Python dispatch overhead from the autoregressive decode
+        # loop. CUDA only. Compilation is lazy, so backend failures surface
+        # at the first inference call — suppress_errors makes Dynamo fall
+        # back to eager (with a logged warning) per failing graph instead of
+        # crashing the run. Input lengths are not bucketed to a fixed
+        # multiple: chichat's inference API exposes no attention-mask/pad
+        # path, so padded text tokens would change the output; we rely on
+        # Dynamo promoting the length dim to dynamic after the first
+        # recompile rather than recompiling per distinct text length.
+        if device == "cuda" and hasattr(torch, "compile"):
+            torch._dynamo.config.suppress_errors = True
+            t3.inference = torch.compile(t3.inference, mode="reduce-overhead")
+            s3gen.inference = torch.compile(s3gen.inference, mode="reduce-overhead")
 
         tokenizer = EnTokenizer(
             str(ckpt_dir / "tokenizer.json")
@@ -180,6 +277,8 @@ class ChatterboxTTS:
 
     @classmethod
     def from_pretrained(cls, device, vae_path, clip_path, model_path) -> 'ChatterboxTTS':
+        from huggingface_hub import hf_hub_download
+
         # Check if MPS is available on macOS
         if device == "mps" and not torch.backends.mps.is_available():
             if not torch.backends.mps.is_built():
@@ -193,10 +292,30 @@ class ChatterboxTTS:
 
         return cls.from_local(Path(local_path).parent, device, vae_path, clip_path, model_path)
 
+    def _resample(self, wav, orig_sr, target_sr):
+        import torchaudio
+
+        if orig_sr == target_sr:
+            return wav
+        key = (orig_sr, target_sr)
+        if key not in self._resamplers:
+            self._resamplers[key] = torchaudio.transforms.Resample(
+                orig_sr, target_sr, lowpass_filter_width=16
+            ).to(self.device)
+        return self._resamplers[key](wav)
+
     def prepare_conditionals(self, wav_fpath, exaggeration=0.5):
-        ## Load reference wav
-        s3gen_ref_wav, _sr = librosa.load(wav_fpath, sr=S3GEN_SR)
-        ref_16k_wav = librosa.resample(s3gen_ref_wav, orig_sr=S3GEN_SR, target_sr=S3_SR)
+        import torchaudio
+        from chichat.chatterbox.models.s3tokenizer import S3_SR
+        from chichat.chatterbox.models.s3gen import S3GEN_SR
+        from chichat.chatterbox.models.t3.modules.cond_enc import T3Cond
+
+        ## Load reference wav once at native SR, then resample both targets
+        ## on self.device instead of librosa's single-threaded CPU polyphase
+        ref_wav, ref_sr = torchaudio.load(wav_fpath)
+        ref_wav = ref_wav.mean(0).to(self.device)
+        s3gen_ref_wav = self._resample(ref_wav, ref_sr, S3GEN_SR)
+        ref_16k_wav = self._resample(ref_wav, ref_sr, S3_SR)
         s3gen_ref_wav = s3gen_ref_wav[:self.DEC_COND_LEN]
         s3gen_ref_dict = self.s3gen.embed_ref(s3gen_ref_wav, S3GEN_SR, device=self.device)
         # Speech cond prompt tokens
@@ -204,17 +323,25 @@ class ChatterboxTTS:
             s3_tokzr = self.s3gen.tokenizer
             t3_cond_prompt_tokens, _ = s3_tokzr.forward([ref_16k_wav[:self.ENC_COND_LEN]], max_len=plen)
             t3_cond_prompt_tokens = torch.atleast_2d(t3_cond_prompt_tokens).to(self.device)
-        # Voice-encoder speaker embedding
-        ve_embed = torch.from_numpy(self.ve.embeds_from_wavs([ref_16k_wav], sample_rate=S3_SR))
-        ve_embed = ve_embed.mean(axis=0, keepdim=True).to(self.device)
+        # Voice-encoder speaker embedding: prefer the tensor path so the
+        # forward stays on self.device instead of detouring through a numpy
+        # copy on the host
+        if hasattr(self.ve, "embed_utterance_tensor"):
+            ve_embed = self.ve.embed_utterance_tensor(ref_16k_wav, S3_SR)
+        else:
+            ve_embed = torch.from_numpy(
+                self.ve.embeds_from_wavs([ref_16k_wav.cpu().numpy()], sample_rate=S3_SR)
+            )
+            ve_embed = ve_embed.to(self.device)
+        ve_embed = ve_embed.mean(dim=0, keepdim=True)
         t3_cond = T3Cond(
             speaker_emb=ve_embed,
             cond_prompt_speech_tokens=t3_cond_prompt_tokens,
-            emotion_adv=exaggeration * torch.ones(1, 1, 1),
+            emotion_adv=torch.full((1, 1, 1), exaggeration, device=self.device),
         ).to(device=self.device)
         self.conds = Conditionals(t3_cond, s3gen_ref_dict)
 
-    def generate(
+    def _synthesize(
         self,
         text,
         audio_prompt_path=None,
@@ -226,48 +353,153 @@ class ChatterboxTTS:
             self.prepare_conditionals(audio_prompt_path, exaggeration=exaggeration)
         else:
             assert self.conds is not None, "Please `prepare_conditionals` first or specify `audio_prompt_path`"
-        # Update exaggeration if needed
-        if exaggeration != self.conds.t3.emotion_adv[0, 0, 0]:
-            _cond: T3Cond = self.conds.t3
-            self.conds.t3 = T3Cond(
-                speaker_emb=_cond.speaker_emb,
-                cond_prompt_speech_tokens=_cond.cond_prompt_speech_tokens,
-                emotion_adv=exaggeration * torch.ones(1, 1, 1),
-            ).to(device=self.device)
+        # Update exaggeration in place: emotion_adv is a (1, 1, 1) tensor, so
+        # filling it avoids a fresh allocation and a T3Cond rebuild per call
+        self.conds.t3.emotion_adv.fill_(exaggeration)
         # Norm and tokenize text
         text = punc_norm(text)
         text_tokens = self.tokenizer.text_to_tokens(text).to(self.device)
 
-        if cfg_weight > 0.0:
-            text_tokens = torch.cat([text_tokens, text_tokens], dim=0)  # Need two seqs for CFG
-
         sot = self.t3.hp.start_text_token
         eot = self.t3.hp.stop_text_token
-        text_tokens = F.pad(text_tokens, (1, 0), value=sot)
-        text_tokens = F.pad(text_tokens, (0, 1), value=eot)
-
-        with torch.inference_mode():
-            speech_tokens = self.t3.inference(
-                t3_cond=self.conds.t3,
-                text_tokens=text_tokens,
-                max_new_tokens=1000,  # TODO: use the value in config
-                temperature=temperature,
-                cfg_weight=cfg_weight,
-            )
+        # Frame with SOT/EOT in one preallocated buffer: a single alloc+copy
+        # instead of the two chained F.pad allocations
+        B, L = text_tokens.shape
+        framed = text_tokens.new_empty(B, L + 2)
+        framed[:, 0] = sot
+        framed[:, 1:1 + L] = text_tokens
+        framed[:, -1] = eot
+        text_tokens = framed
+
+        if cfg_weight > 0.0:
+            # Need two identical seqs for CFG: pad first, then expand to a
+            # stride-0 view instead of materializing a 2x copy with torch.cat
+            text_tokens = text_tokens.expand(2, -1)
+
+        # BF16 autocast on CUDA: the CLI already loads bf16 weights there, so
+        # run the T3/S3Gen matmuls on tensor cores at matching precision
+        if str(self.device).startswith("cuda"):
+            amp_ctx = torch.autocast("cuda", dtype=torch.bfloat16)
+        else:
+            amp_ctx = contextlib.nullcontext()
+        t3_kwargs = dict(
+            t3_cond=self.conds.t3,
+            text_tokens=text_tokens,
+            max_new_tokens=1000,  # TODO: use the value in config
+            temperature=temperature,
+            cfg_weight=cfg_weight,
+        )
+        if self._t3_takes_generator:
+            t3_kwargs["generator"] = self.rng
+        with torch.inference_mode(), amp_ctx:
+            speech_tokens = self.t3.inference(**t3_kwargs)
             # Extract only the conditional batch.
             speech_tokens = speech_tokens[0]
             # TODO: output becomes 1D
-            speech_tokens = drop_invalid_tokens(speech_tokens)
-            speech_tokens = speech_tokens.to(self.device)
+            # Drop SOS/EOS and any out-of-range ids with one on-device mask
+            # kernel (the special tokens sit at the top of the speech vocab,
+            # from start_speech_token up) instead of chichat's
+            # drop_invalid_tokens helper, which detours through the host
+            valid = (speech_tokens >= 0) & (speech_tokens < self.t3.hp.start_speech_token)
+            speech_tokens = speech_tokens[valid]
             wav, _ = self.s3gen.inference(
                 speech_tokens=speech_tokens,
                 ref_dict=self.conds.gen,
             )
-            wav = wav.squeeze(0).detach().cpu().numpy()
-        return torch.from_numpy(wav).unsqueeze(0)
+        # (T,) on self.device; cast back to float32 at the autocast boundary
+        # so callers (and .numpy()) never see a bf16 waveform
+        return wav.squeeze(0).detach().float()
+
+    def generate(
+        self,
+        text,
+        audio_prompt_path=None,
+        exaggeration=0.5,
+        cfg_weight=0.5,
+        temperature=0.8,
+    ):
+        wav = self._synthesize(
+            text,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            temperature=temperature,
+        )
+        return wav.cpu().unsqueeze(0)
+
+    def _pinned_host_buf(self, n):
+        # Pinned pages are expensive to allocate, so keep one buffer for the
+        # life of the instance and grow it geometrically when a caller needs
+        # more; D2H copies into pinned memory run async and ~2x faster than
+        # into pageable memory
+        if self._host_buf is None:
+            self._host_buf = torch.empty(n, dtype=torch.float32, pin_memory=True)
+        elif self._host_buf.numel() < n:
+            new_cap = max(n, 2 * self._host_buf.numel())
+            self._host_buf = torch.empty(new_cap, dtype=torch.float32, pin_memory=True)
+        return self._host_buf
+
+    def generate_stream(
+        self,
+        text,
+        audio_prompt_path=None,
+        exaggeration=0.5,
+        cfg_weight=0.5,
+        temperature=0.8,
+        chunk_samples=24000,
+    ):
+        """
+        Yield synthesized audio as float32 numpy chunks of up to
+        `chunk_samples` samples (~1s at 24kHz). On CUDA each chunk is
+        copied device->host on a side stream into a pinned buffer, so the
+        PCIe transfer overlaps with whatever the caller does with the
+        previous chunk (e.g. sf.SoundFile.write) and first audio is
+        available before the tail is copied.
+        """
+        wav = self._synthesize(
+            text,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            temperature=temperature,
+        )
+        if not str(self.device).startswith("cuda"):
+            # .numpy() only works on CPU tensors; on MPS this is the one
+            # blocking D2H copy, matching what generate() does
+            wav = wav.cpu()
+            for start in range(0, wav.numel(), chunk_samples):
+                yield wav[start:start + chunk_samples].numpy().copy()
+            return
+        copy_stream = torch.cuda.Stream()
+        # Side streams don't implicitly order against the default stream:
+        # make the copies wait for the kernels that produced wav
+        copy_stream.wait_stream(torch.cuda.current_stream())
+        # Double-buffer two pinned halves: issue the copy for chunk i, then
+        # wait on and yield chunk i-1, so each transfer runs while the
+        # caller consumes the previous chunk
+        host_buf = self._pinned_host_buf(2 * chunk_samples)
+        pending = None  # (event, offset, n) of the copy in flight
+        for i, start in enumerate(range(0, wav.numel(), chunk_samples)):
+            chunk = wav[start:start + chunk_samples]
+            n = chunk.numel()
+            offset = (i % 2) * chunk_samples
+            with torch.cuda.stream(copy_stream):
+                host_buf[offset:offset + n].copy_(chunk, non_blocking=True)
+            done = torch.cuda.Event()
+            done.record(copy_stream)
+            if pending is not None:
+                prev_done, prev_offset, prev_n = pending
+                prev_done.synchronize()
+                yield host_buf[prev_offset:prev_offset + prev_n].numpy().copy()
+            pending = (done, offset, n)
+        if pending is not None:
+            prev_done, prev_offset, prev_n = pending
+            prev_done.synchronize()
+            yield host_buf[prev_offset:prev_offset + prev_n].numpy().copy()
 
 if __name__ == "__main__":
     import argparse
+    import hashlib
     import soundfile as sf
     import time
     
@@ -295,50 +527,61 @@ if __name__ == "__main__":
 
     # 2. Convert GGUF to Safetensors
     print("Preparing models...")
-    # Use cache dir instead of hardcoded relative path
-    # If using absolute paths for inputs, place safetensors next to them
-    
+    # Converted files live in a shared cache keyed by a content fingerprint
+    # of the source GGUF: cache hits survive across runs/projects and go
+    # stale automatically if a GGUF is swapped under the same filename
+
     use_bf16 = (DEVICE == "cuda")
     suffix = "bf16" if use_bf16 else "f32"
-    
+
+    cache_dir = os.environ.get("GENHAT_CACHE", os.path.expanduser("~/.cache/genhat"))
+    os.makedirs(cache_dir, exist_ok=True)
+
+    def gguf_fingerprint(gguf_path):
+        # Hash of the first 64 KB (header + tensor index) plus file size is
+        # enough to tell GGUF builds apart without reading the whole file
+        size = os.path.getsize(gguf_path)
+        with open(gguf_path, "rb") as f:
+            head = f.read(65536)
+        return hashlib.blake2b(head + size.to_bytes(8, "little"), digest_size=16).hexdigest()
+
     def get_st_path(gguf_path):
-        d = os.path.dirname(gguf_path)
-        n = os.path.splitext(os.path.basename(gguf_path))[0]
-        return os.path.join(d, f"{n}-{suffix}.safetensors")
+        return os.path.join(cache_dir, f"{gguf_fingerprint(gguf_path)}-{suffix}.safetensors")
+
+    def ensure_converted(name, gguf_path, st_path):
+        # Runs on a worker thread: return the status line instead of printing
+        # so output from concurrent conversions doesn't interleave
+        if os.path.exists(st_path):
+            return f"  {name}: {st_path} (already converted)"
+        tmp_path = st_path + ".tmp"
+        try:
+            convert_gguf_to_safetensors(gguf_path, tmp_path, use_bf16)
+            os.replace(tmp_path, st_path)  # atomic publish into the cache
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return f"  {name}: {gguf_path} -> {st_path}"
 
     vae_s_path = get_st_path(args.vae_gguf)
     clip_s_path = get_st_path(args.clip_gguf)
     model_s_path = get_st_path(args.model_gguf)
 
-    print(f"  VAE: {args.vae_gguf} -> {vae_s_path}")
-    if not os.path.exists(vae_s_path):
-        try:
-            convert_gguf_to_safetensors(args.vae_gguf, vae_s_path, use_bf16)
-        except Exception as e:
-            print(f"Error converting VAE: {e}")
-            sys.exit(1)
-    else:
-        print("  (Already converted)")
-
-    print(f"  CLIP: {args.clip_gguf} -> {clip_s_path}")
-    if not os.path.exists(clip_s_path):
-        try:
-            convert_gguf_to_safetensors(args.clip_gguf, clip_s_path, use_bf16)
-        except Exception as e:
-            print(f"Error converting CLIP: {e}")
-            sys.exit(1)
-    else:
-        print("  (Already converted)")
-
-    print(f"  Model: {args.model_gguf} -> {model_s_path}")
-    if not os.path.exists(model_s_path):
-        try:
-            convert_gguf_to_safetensors(args.model_gguf, model_s_path, use_bf16)
-        except Exception as e:
-            print(f"Error converting Model: {e}")
-            sys.exit(1)
-    else:
-        print("  (Already converted)")
+    # The three conversions are independent and dominated by disk I/O plus
+    # GIL-releasing numpy/tensor work, so run them concurrently
+    jobs = [
+        ("VAE", args.vae_gguf, vae_s_path),
+        ("CLIP", args.clip_gguf, clip_s_path),
+        ("Model", args.model_gguf, model_s_path),
+    ]
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futs = {ex.submit(ensure_converted, n, g, s): n for n, g, s in jobs}
+        for fut in as_completed(futs):
+            try:
+                print(fut.result())
+            except Exception as e:
+                print(f"Error converting {futs[fut]}: {e}")
+                sys.exit(1)
 
     print("\nLoading model weights...")
     try:
@@ -351,7 +594,11 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error loading model: {e}")
         sys.exit(1)
-    
+
+    # set_seed above is the one-shot global seed; the instance generator is
+    # what sampling actually consumes
+    tts.rng.manual_seed(args.seed)
+
     if args.ref_wav:
         if os.path.exists(args.ref_wav):
             print(f"Using reference audio: {args.ref_wav}")
@@ -363,14 +610,12 @@ if __name__ == "__main__":
 
     print(f"Generating audio for text: '{args.text}'")
     start = time.time()
-    audio = tts.generate(args.text)
+    # Stream chunks straight into the file so writing overlaps the
+    # device->host copies instead of waiting for the full waveform
+    with sf.SoundFile(args.output, "w", samplerate=tts.sr, channels=1, format="WAV") as f:
+        for chunk in tts.generate_stream(args.text):
+            f.write(chunk)
     end = time.time()
-    
+
     print(f"Inference took {end - start:.2f}s")
-    
-    # Check output shape: (1, T) tensor -> needs (T,) numpy array for sf.write
-    if hasattr(audio, 'squeeze'):
-        audio = audio.squeeze().cpu().numpy()
-        
-    sf.write(args.output, audio, tts.sr)
     print(f"Audio saved to {args.output}")
\ No newline at end of file